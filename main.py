@@ -7,37 +7,66 @@ PyQt6界面设计器启动器
 
 import sys
 import os
+import atexit
+import queue
 import logging
+import logging.handlers
 from pathlib import Path
 
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtWidgets import QApplication
 from ui_launcher import DesignerLauncher
+from utils import get_log_file, IS_FROZEN
 
 # 获取项目根目录
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-ICON_PATH = os.path.join(BASE_DIR, "icon.png")  # 或 .ico
+BASE_DIR = Path(__file__).resolve().parent
+ICON_PATH = BASE_DIR / "icon.png"  # 或 .ico
+
+# 日志文件路径，setup_logging 与 handle_exception 共用
+LOG_FILE = get_log_file()
+
+# 已加载的图标缓存，键为图标文件路径
+_ICON_CACHE = {}
+
+
+def app_icon(path=ICON_PATH):
+    """获取程序图标，同一路径的图标只从磁盘加载一次"""
+    key = str(path)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = _ICON_CACHE[key] = QIcon(key)
+    return icon
 
 
 def setup_logging():
     """设置日志记录"""
-    # 获取程序运行目录
-    if getattr(sys, 'frozen', False):
-        # PyInstaller打包后的环境
-        app_dir = Path(sys.executable).parent
-    else:
-        # 开发环境
-        app_dir = Path(__file__).parent
+    # 默认只记录INFO及以上级别，设置环境变量 LAUNCHER_DEBUG=1 时开启DEBUG日志
+    level = logging.DEBUG if os.environ.get("LAUNCHER_DEBUG") == "1" else logging.INFO
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
+                                  datefmt='%Y-%m-%d %H:%M:%S')
+    # 延迟到第一条日志时才打开文件
+    file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8', delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    # 日志记录先放入队列，由后台线程写入文件，避免阻塞界面线程
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    # 退出时停止监听线程，确保队列中剩余的日志写入文件
+    atexit.register(listener.stop)
 
-    log_file = app_dir / "launcher.log"
+    # 队列处理器只负责传递消息，最终格式由文件和控制台处理器决定
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
 
     logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        level=level,
+        handlers=[queue_handler]
     )
 
     return logging.getLogger(__name__)
@@ -60,29 +89,31 @@ def handle_exception(exc_type, exc_value, exc_traceback):
 错误类型: {exc_type.__name__}
 错误信息: {str(exc_value)}
 
-日志文件位置: {Path(sys.executable if getattr(sys, 'frozen', False) else __file__).parent / 'launcher.log'}
+日志文件位置: {LOG_FILE}
 """
 
+    # 只在界面已经启动时弹出对话框，不在异常处理中新建QApplication
     try:
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
+        from PyQt6.QtWidgets import QApplication, QMessageBox
+        if QApplication.instance() is not None:
+            QMessageBox.critical(None, "程序错误", error_msg)
+            return
+    except Exception:
+        pass
 
-        QMessageBox.critical(None, "程序错误", error_msg)
-    except:
-        # 如果Qt界面也无法显示，直接打印到控制台
-        print(error_msg)
+    # 如果Qt界面无法显示，直接打印到控制台
+    print(error_msg)
 
 
 def main():
     """主函数"""
+    # 最先设置全局异常处理器，以便记录启动阶段的异常
+    sys.excepthook = handle_exception
+
     # 设置日志记录
     logger = setup_logging()
     logger.info("程序启动")
 
-    # 设置全局异常处理器
-    sys.excepthook = handle_exception
-
     try:
         app = QApplication(sys.argv)
 
@@ -92,12 +123,12 @@ def main():
         app.setOrganizationName("HeMOua")
 
         # 设置窗口图标
-        app.setWindowIcon(QIcon(ICON_PATH))
+        app.setWindowIcon(app_icon())
 
         # 记录运行环境信息
         logger.info(f"Python版本: {sys.version}")
-        logger.info(f"运行环境: {'PyInstaller打包' if getattr(sys, 'frozen', False) else '开发环境'}")
-        logger.info(f"程序路径: {sys.executable if getattr(sys, 'frozen', False) else __file__}")
+        logger.info(f"运行环境: {'PyInstaller打包' if IS_FROZEN else '开发环境'}")
+        logger.info(f"程序路径: {sys.executable if IS_FROZEN else __file__}")
 
         # 创建主窗口
         window = DesignerLauncher()
@@ -113,6 +144,7 @@ def main():
     except Exception as e:
         logger.error(f"主函数发生异常: {str(e)}", exc_info=True)
         try:
+            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(None, "启动错误", f"程序启动失败:\n{str(e)}")
         except:
             print(f"程序启动失败: {str(e)}")
@@ -1 +1 @@
-pyinstaller -F -w -i icon.ico main.py --add-data "icon.ico;." --add-data "icon.png;."
\ No newline at end of file
+pyinstaller -F -w -i icon.ico main.py --add-data "icon.ico;." --add-data "icon.png;." --add-data "designer_path_hint.json;."
\ No newline at end of file
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+utils 模块测试
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import LauncherConfig
+
+
+class LauncherConfigTest(unittest.TestCase):
+    """LauncherConfig 测试"""
+
+    def test_unknown_keys_round_trip(self):
+        """未知字段经过 from_dict/to_dict 后保持不变"""
+        data = {'auto_detect': False, 'designer_path': '/usr/bin/designer',
+                'future_option': {'a': 1}}
+        config = LauncherConfig.from_dict(data)
+        config.designer_path = '/opt/Qt/bin/designer'
+
+        self.assertEqual(config.to_dict(), {
+            'auto_detect': False,
+            'designer_path': '/opt/Qt/bin/designer',
+            'future_option': {'a': 1},
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,54 +7,120 @@ PyQt6界面设计器启动器
 
 import os
 import sys
-import subprocess
-import platform
 import logging
+import functools
 from pathlib import Path
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QGridLayout, QPushButton, QLabel, QLineEdit,
-                             QFileDialog, QTextEdit, QGroupBox, QProgressBar,
-                             QMessageBox, QStatusBar, QFrame, QSplitter,
-                             QCheckBox, QMenuBar, QMenu)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QIcon, QPalette, QPixmap, QAction
+# 仅导入构建初始窗口所需的类，其余在使用处延迟导入以加快启动
+from PyQt6.QtWidgets import QMainWindow
+from PyQt6.QtCore import (Qt, QObject, QThread, QThreadPool, QRunnable, QMetaObject,
+                          Q_ARG, pyqtSignal, pyqtSlot, QTimer)
+from ui_launcher_ui import Ui_DesignerLauncher
 from utils import (find_designer_path, convert_ui_to_py, test_designer_executable,
-                   save_config, load_config, get_system_info, check_pyqt6_installation)
+                   save_config, load_config, get_system_info, check_pyqt6_installation,
+                   get_log_file, LauncherConfig)
 
 logger = logging.getLogger(__name__)
 
-
-class ConvertThread(QThread):
-    """UI转换线程"""
+# 运行平台在解释器启动时即已确定，缓存判断结果
+_IS_WINDOWS = sys.platform.startswith("win")
+_IS_MAC = sys.platform == "darwin"
+
+
+def _gui_errors(title, message):
+    """界面事件处理的统一异常处理：记录日志并弹出错误对话框
+
+    被装饰的方法不接受参数，包装函数也只接受 self，
+    避免 clicked 等信号把额外参数传入。
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self):
+            try:
+                return func(self)
+            except Exception as e:
+                from PyQt6.QtWidgets import QMessageBox
+                logger.error(f"{message}: {str(e)}", exc_info=True)
+                QMessageBox.critical(self, title, f"{message}:\n{str(e)}")
+        return wrapper
+    return decorator
+
+
+class ConvertWorker(QObject):
+    """UI转换工作对象，常驻在后台线程中，通过 job 信号接收转换任务"""
+    job = pyqtSignal(str, str)
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
 
-    def __init__(self, ui_file, output_dir):
-        super().__init__()
-        self.ui_file = ui_file
-        self.output_dir = output_dir
-
-    def run(self):
+    @pyqtSlot(str, str)
+    def do_convert(self, ui_file, output_dir):
         try:
-            logger.info(f"转换线程启动: {self.ui_file}")
             self.progress.emit("开始转换...")
-            success, message = convert_ui_to_py(self.ui_file, self.output_dir)
+            success, message = convert_ui_to_py(ui_file, output_dir)
             self.finished.emit(success, message)
         except Exception as e:
-            logger.error(f"转换线程异常: {str(e)}", exc_info=True)
+            logger.error(f"转换任务异常: {str(e)}", exc_info=True)
             self.finished.emit(False, f"转换过程中发生错误: {str(e)}")
 
 
-class DesignerLauncher(QMainWindow):
+class _DetectRunnable(QRunnable):
+    """在线程池中检测Designer路径，完成后回调主窗口的 _on_detect_done"""
+
+    def __init__(self, receiver):
+        super().__init__()
+        self._receiver = receiver
+
+    def run(self):
+        path, error = "", ""
+        try:
+            path = find_designer_path() or ""
+        except Exception as e:
+            logger.error(f"Designer路径检测失败: {str(e)}", exc_info=True)
+            error = str(e)
+
+        try:
+            QMetaObject.invokeMethod(self._receiver, "_on_detect_done",
+                                     Qt.ConnectionType.QueuedConnection,
+                                     Q_ARG(str, path), Q_ARG(str, error))
+        except RuntimeError:
+            # 检测完成前窗口已被销毁
+            pass
+
+
+class DesignerLauncher(QMainWindow, Ui_DesignerLauncher):
     """PyQt6界面设计器启动器主窗口"""
 
     def __init__(self):
         super().__init__()
         logger.info("初始化主窗口")
 
-        self.designer_path = None
-        self.convert_thread = None
-        self.config = load_config()
+        self._designer_path = None
+        self.config = LauncherConfig.from_dict(load_config())
+        # 最近一次保存的配置，未变化时跳过写入
+        self._last_saved = self.config.snapshot()
+
+        # 系统信息在运行期间不会变化，首次显示时生成并缓存
+        self._sysinfo_cache = None
+
+        # 界面和菜单只构建一次，重复调用 init_ui/init_menu 时直接返回
+        self._ui_built = False
+        self._menu_built = False
+
+        # 转换工作线程在窗口生命周期内只创建一次，每次转换通过信号投递任务
+        self._worker_thread = QThread(self)
+        self._worker = ConvertWorker()
+        self._worker.moveToThread(self._worker_thread)
+        self._worker.job.connect(self._worker.do_convert, Qt.ConnectionType.QueuedConnection)
+        self._worker.progress.connect(self.on_convert_progress)
+        self._worker.finished.connect(self.on_convert_finished)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self._worker_thread.start()
+
+        # 输出信息先缓存，由定时器合并后一次性写入文本框，避免频繁重新排版
+        self._pending_msgs = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_output)
 
         try:
             self.init_ui()
@@ -62,11 +128,27 @@ class DesignerLauncher(QMainWindow):
             self.init_designer_path()
             logger.info("主窗口初始化完成")
         except Exception as e:
+            from PyQt6.QtWidgets import QMessageBox
             logger.error(f"主窗口初始化失败: {str(e)}", exc_info=True)
             QMessageBox.critical(self, "初始化错误", f"主窗口初始化失败:\n{str(e)}")
 
+    @property
+    def designer_path(self):
+        """当前Designer路径（字符串），未设置时为None"""
+        return str(self._designer_path) if self._designer_path else None
+
+    @designer_path.setter
+    def designer_path(self, path):
+        # 只在设置时构造一次Path对象，后续启动时直接复用
+        self._designer_path = Path(path) if path else None
+
     def init_menu(self):
         """初始化菜单栏"""
+        from PyQt6.QtGui import QAction
+
+        if self._menu_built:
+            return
+
         try:
             menubar = self.menuBar()
 
@@ -74,392 +156,222 @@ class DesignerLauncher(QMainWindow):
             help_menu = menubar.addMenu('帮助(&H)')
 
             # 系统信息
-            system_info_action = QAction('系统信息(&S)', self)
-            system_info_action.triggered.connect(self.show_system_info)
-            help_menu.addAction(system_info_action)
+            self._system_info_action = QAction('系统信息(&S)', self)
+            self._system_info_action.triggered.connect(self.show_system_info)
+            help_menu.addAction(self._system_info_action)
 
             # 查看日志
-            view_log_action = QAction('查看日志(&L)', self)
-            view_log_action.triggered.connect(self.view_log)
-            help_menu.addAction(view_log_action)
+            self._view_log_action = QAction('查看日志(&L)', self)
+            self._view_log_action.triggered.connect(self.view_log)
+            help_menu.addAction(self._view_log_action)
 
             help_menu.addSeparator()
 
             # 关于
-            about_action = QAction('关于(&A)', self)
-            about_action.triggered.connect(self.show_about)
-            help_menu.addAction(about_action)
+            self._about_action = QAction('关于(&A)', self)
+            self._about_action.triggered.connect(self.show_about)
+            help_menu.addAction(self._about_action)
 
+            self._menu_built = True
         except Exception as e:
             logger.error(f"菜单初始化失败: {str(e)}")
 
     def init_ui(self):
         """初始化用户界面"""
-        self.setWindowTitle("PyQt6界面设计器启动器 v1.0.1")
-        self.setGeometry(100, 100, 800, 600)
-        self.setMinimumSize(600, 400)
-
-        # 设置样式
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2c3e50;
-            }
-            QPushButton {
-                background-color: #3498db;
-                border: none;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-            QLineEdit {
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-            }
-            QTextEdit {
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                background-color: white;
-            }
-        """)
-
-        # 创建中央部件
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-
-        # 主布局
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setSpacing(15)
-        main_layout.setContentsMargins(15, 15, 15, 15)
-
-        # 创建标题
-        title_label = QLabel("PyQt6界面设计器启动器")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                font-size: 24px;
-                font-weight: bold;
-                margin: 10px 0;
-                background-color: transparent;
-            }
-        """)
-        main_layout.addWidget(title_label)
-
-        # 创建分割器
-        splitter = QSplitter(Qt.Orientation.Vertical)
-        main_layout.addWidget(splitter)
-
-        # Qt Designer 启动区域
-        designer_group = self.create_designer_group()
-        splitter.addWidget(designer_group)
-
-        # UI转换区域
-        convert_group = self.create_convert_group()
-        splitter.addWidget(convert_group)
-
-        # 设置分割器比例
-        splitter.setSizes([200, 400])
-
-        # 创建状态栏
-        self.statusBar = QStatusBar()
-        self.setStatusBar(self.statusBar)
-        self.statusBar.showMessage("就绪")
-
-    def create_designer_group(self):
-        """创建Qt Designer启动组"""
-        group = QGroupBox("Qt Designer 启动器")
-        layout = QVBoxLayout(group)
-        layout.setSpacing(10)
-
-        # Designer路径显示
-        path_layout = QHBoxLayout()
-        path_label = QLabel("Designer路径:")
-        self.path_edit = QLineEdit()
-        self.path_edit.setReadOnly(True)
-        self.path_edit.setPlaceholderText("正在检测Qt Designer路径...")
-
-        browse_btn = QPushButton("浏览")
-        browse_btn.clicked.connect(self.browse_designer_path)
-        browse_btn.setMaximumWidth(80)
-
-        test_btn = QPushButton("测试")
-        test_btn.clicked.connect(self.test_designer_path)
-        test_btn.setMaximumWidth(60)
-
-        path_layout.addWidget(path_label)
-        path_layout.addWidget(self.path_edit)
-        path_layout.addWidget(browse_btn)
-        path_layout.addWidget(test_btn)
-        layout.addLayout(path_layout)
-
-        # 自动检测复选框
-        self.auto_detect_cb = QCheckBox("启动时自动检测Designer路径")
-        self.auto_detect_cb.setChecked(self.config.get('auto_detect', True))
-        self.auto_detect_cb.stateChanged.connect(self.save_settings)
-        layout.addWidget(self.auto_detect_cb)
+        if self._ui_built:
+            return
+
+        # 控件树由 Ui_DesignerLauncher 构建，这里只负责设置初始状态和连接信号
+        self.setupUi(self)
 
-        # 启动按钮
-        button_layout = QHBoxLayout()
-        self.launch_btn = QPushButton("🎨 启动 Qt Designer")
+        self.auto_detect_cb.setChecked(self.config.auto_detect)
+
+        self.browse_btn.clicked.connect(self.browse_designer_path)
+        self.test_btn.clicked.connect(self.test_designer_path)
+        self.auto_detect_cb.stateChanged.connect(self.save_settings)
         self.launch_btn.clicked.connect(self.launch_designer)
-        self.launch_btn.setEnabled(False)
-        self.launch_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-                padding: 12px 24px;
-                background-color: #27ae60;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:pressed {
-                background-color: #1e8449;
-            }
-        """)
-
-        button_layout.addStretch()
-        button_layout.addWidget(self.launch_btn)
-        button_layout.addStretch()
-        layout.addLayout(button_layout)
-
-        return group
-
-    def create_convert_group(self):
-        """创建UI转换组"""
-        group = QGroupBox("UI文件转换器")
-        layout = QVBoxLayout(group)
-        layout.setSpacing(10)
-
-        # 文件选择区域
-        file_layout = QGridLayout()
-
-        # UI文件选择
-        ui_label = QLabel("UI文件:")
-        self.ui_file_edit = QLineEdit()
-        self.ui_file_edit.setPlaceholderText("选择要转换的.ui文件")
-        ui_browse_btn = QPushButton("选择文件")
-        ui_browse_btn.clicked.connect(self.browse_ui_file)
-
-        file_layout.addWidget(ui_label, 0, 0)
-        file_layout.addWidget(self.ui_file_edit, 0, 1)
-        file_layout.addWidget(ui_browse_btn, 0, 2)
-
-        # 输出目录选择
-        output_label = QLabel("输出目录:")
-        self.output_dir_edit = QLineEdit()
-        self.output_dir_edit.setPlaceholderText("选择输出目录（默认为UI文件同目录）")
-        output_browse_btn = QPushButton("选择目录")
-        output_browse_btn.clicked.connect(self.browse_output_dir)
-
-        file_layout.addWidget(output_label, 1, 0)
-        file_layout.addWidget(self.output_dir_edit, 1, 1)
-        file_layout.addWidget(output_browse_btn, 1, 2)
-
-        layout.addLayout(file_layout)
-
-        # 转换按钮
-        convert_layout = QHBoxLayout()
-        self.convert_btn = QPushButton("🔄 转换为Python文件")
+        self.ui_browse_btn.clicked.connect(self.browse_ui_file)
+        self.output_browse_btn.clicked.connect(self.browse_output_dir)
         self.convert_btn.clicked.connect(self.convert_ui_file)
-        self.convert_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-                padding: 10px 20px;
-                background-color: #e74c3c;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
-
-        convert_layout.addStretch()
-        convert_layout.addWidget(self.convert_btn)
-        convert_layout.addStretch()
-        layout.addLayout(convert_layout)
-
-        # 进度条
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        layout.addWidget(self.progress_bar)
-
-        # 输出信息
-        self.output_text = QTextEdit()
-        self.output_text.setPlaceholderText("转换信息将在这里显示...")
-        layout.addWidget(self.output_text)
-
-        return group
+
+        self._ui_built = True
+
+    def append_output(self, message, level=logging.INFO, log=True):
+        """追加一条输出信息，同时写入日志
+
+        输出区域只显示纯文本，不带表情符号，避免文本框排版时走较慢的字体回退路径。
+        消息已在别处记录过日志时传入 log=False，避免重复记录。
+        """
+        if log:
+            logger.log(level, message)
+        self._pending_msgs.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_output(self):
+        """将缓存的输出信息写入文本框"""
+        from PyQt6.QtGui import QTextCursor
+
+        if not self._pending_msgs:
+            return
+
+        text = "\n".join(self._pending_msgs)
+        self._pending_msgs.clear()
+        if not self.output_text.document().isEmpty():
+            text = "\n" + text
+
+        self.output_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.output_text.insertPlainText(text)
+        self.output_text.ensureCursorVisible()
 
     def init_designer_path(self):
         """初始化Designer路径"""
         if self.auto_detect_cb.isChecked():
-            QTimer.singleShot(100, self.detect_designer_path)
+            self.detect_designer_path()
         else:
             # 尝试从配置加载
-            saved_path = self.config.get('designer_path')
-            if saved_path and os.path.exists(saved_path):
+            saved_path = self.config.designer_path
+            if saved_path and os.path.isfile(saved_path):
                 self.designer_path = saved_path
                 self.path_edit.setText(saved_path)
                 self.launch_btn.setEnabled(True)
                 self.statusBar.showMessage("已加载保存的Designer路径")
 
     def detect_designer_path(self):
-        """检测Designer路径"""
-        try:
-            self.statusBar.showMessage("正在检测Qt Designer路径...")
-            self.output_text.append("🔍 开始检测Qt Designer路径...")
-
-            path = find_designer_path()
-
-            if path:
-                self.designer_path = path
-                self.path_edit.setText(path)
-                self.path_edit.setStyleSheet("")
-                self.launch_btn.setEnabled(True)
-                self.statusBar.showMessage("Qt Designer路径检测成功")
-                self.output_text.append(f"✅ Qt Designer检测成功: {path}")
-            else:
-                self.path_edit.setText("未找到Qt Designer")
-                self.path_edit.setStyleSheet("QLineEdit { color: #e74c3c; }")
-                self.statusBar.showMessage("未找到Qt Designer，请手动指定路径")
-                self.output_text.append("❌ 未找到Qt Designer，请手动指定路径")
-
-        except Exception as e:
-            logger.error(f"Designer路径检测失败: {str(e)}", exc_info=True)
-            self.output_text.append(f"❌ Designer路径检测失败: {str(e)}")
+        """检测Designer路径（在后台线程中进行，不阻塞界面显示）"""
+        self.statusBar.showMessage("正在检测Qt Designer路径...")
+        self.append_output("开始检测Qt Designer路径...")
+        QThreadPool.globalInstance().start(_DetectRunnable(self))
+
+    @pyqtSlot(str, str)
+    def _on_detect_done(self, path, error):
+        """Designer路径检测完成"""
+        if error:
+            self.statusBar.showMessage("Qt Designer路径检测失败")
+            self.append_output(f"Designer路径检测失败: {error}", log=False)
+        elif path:
+            self.designer_path = path
+            self.path_edit.setText(path)
+            self.path_edit.setStyleSheet("")
+            self.launch_btn.setEnabled(True)
+            self.statusBar.showMessage("Qt Designer路径检测成功")
+            self.append_output(f"Qt Designer检测成功: {path}")
+        else:
+            self.path_edit.setText("未找到Qt Designer")
+            self.path_edit.setStyleSheet("QLineEdit { color: #e74c3c; }")
+            self.statusBar.showMessage("未找到Qt Designer，请手动指定路径")
+            self.append_output("未找到Qt Designer，请手动指定路径", log=False)
 
+    @_gui_errors("测试错误", "测试过程中发生错误")
     def test_designer_path(self):
         """测试Designer路径"""
+        from PyQt6.QtWidgets import QMessageBox
+
         if not self.designer_path:
             QMessageBox.warning(self, "警告", "请先选择Designer路径！")
             return
 
-        try:
-            self.statusBar.showMessage("正在测试Designer路径...")
-            if test_designer_executable(self.designer_path):
-                QMessageBox.information(self, "测试成功", "Designer路径有效！")
-                self.output_text.append(f"✅ Designer路径测试成功: {self.designer_path}")
-            else:
-                QMessageBox.warning(self, "测试失败", "Designer路径无效或无法执行！")
-                self.output_text.append(f"❌ Designer路径测试失败: {self.designer_path}")
-        except Exception as e:
-            logger.error(f"Designer路径测试异常: {str(e)}")
-            QMessageBox.critical(self, "测试错误", f"测试过程中发生错误:\n{str(e)}")
+        self.statusBar.showMessage("正在测试Designer路径...")
+        if test_designer_executable(self.designer_path):
+            QMessageBox.information(self, "测试成功", "Designer路径有效！")
+            self.append_output(f"Designer路径测试成功: {self.designer_path}")
+        else:
+            QMessageBox.warning(self, "测试失败", "Designer路径无效或无法执行！")
+            self.append_output(f"Designer路径测试失败: {self.designer_path}", logging.WARNING)
 
     def save_settings(self):
         """保存设置"""
         try:
-            self.config['auto_detect'] = self.auto_detect_cb.isChecked()
+            self.config.auto_detect = self.auto_detect_cb.isChecked()
             if self.designer_path:
-                self.config['designer_path'] = self.designer_path
-            save_config(self.config)
+                self.config.designer_path = self.designer_path
+
+            snapshot = self.config.snapshot()
+            if snapshot == self._last_saved:
+                return
+            save_config(self.config.to_dict())
+            self._last_saved = snapshot
         except Exception as e:
             logger.error(f"保存设置失败: {str(e)}")
 
+    @_gui_errors("错误", "选择文件时发生错误")
     def browse_designer_path(self):
         """浏览Designer路径"""
-        try:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "选择Qt Designer执行文件",
-                "",
-                "可执行文件 (*.exe);;所有文件 (*.*)" if platform.system() == "Windows" else "所有文件 (*.*)"
-            )
-
-            if file_path:
-                self.designer_path = file_path
-                self.path_edit.setText(file_path)
-                self.path_edit.setStyleSheet("")
-                self.launch_btn.setEnabled(True)
-                self.save_settings()
-                self.output_text.append(f"📁 已选择Designer路径: {file_path}")
-        except Exception as e:
-            logger.error(f"浏览Designer路径失败: {str(e)}")
-            QMessageBox.critical(self, "错误", f"选择文件时发生错误:\n{str(e)}")
+        from PyQt6.QtWidgets import QFileDialog
+
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "选择Qt Designer执行文件",
+            "",
+            "可执行文件 (*.exe);;所有文件 (*.*)" if _IS_WINDOWS else "所有文件 (*.*)"
+        )
+
+        if file_path:
+            self.designer_path = file_path
+            self.path_edit.setText(file_path)
+            self.path_edit.setStyleSheet("")
+            self.launch_btn.setEnabled(True)
+            self.save_settings()
+            self.append_output(f"已选择Designer路径: {file_path}")
 
     def launch_designer(self):
         """启动Qt Designer"""
-        if not self.designer_path or not os.path.exists(self.designer_path):
+        from PyQt6.QtCore import QProcess
+        from PyQt6.QtWidgets import QMessageBox
+
+        if not self._designer_path or not self._designer_path.is_file():
             QMessageBox.warning(self, "错误", "Qt Designer路径无效！")
             return
 
         try:
-            logger.info(f"启动Designer: {self.designer_path}")
-            subprocess.Popen([self.designer_path], cwd=os.path.dirname(self.designer_path))
+            # 以分离方式启动，启动器不持有子进程句柄
+            ok, _ = QProcess.startDetached(self.designer_path, [], str(self._designer_path.parent))
+            if not ok:
+                raise RuntimeError("无法创建Qt Designer进程")
             self.statusBar.showMessage("Qt Designer已启动")
-            self.output_text.append(f"✅ Qt Designer已成功启动: {self.designer_path}")
+            self.append_output(f"Qt Designer已成功启动: {self.designer_path}")
         except Exception as e:
-            logger.error(f"启动Designer失败: {str(e)}")
-            QMessageBox.critical(self, "启动失败", f"无法启动Qt Designer:\n{str(e)}")
+            self.append_output(f"Qt Designer启动失败: {str(e)}", logging.ERROR)
             self.statusBar.showMessage("Qt Designer启动失败")
-            self.output_text.append(f"❌ Qt Designer启动失败: {str(e)}")
+            QMessageBox.critical(self, "启动失败", f"无法启动Qt Designer:\n{str(e)}")
 
+    @_gui_errors("错误", "选择文件时发生错误")
     def browse_ui_file(self):
         """浏览UI文件"""
-        try:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "选择UI文件",
-                "",
-                "Qt UI文件 (*.ui);;所有文件 (*.*)"
-            )
-
-            if file_path:
-                self.ui_file_edit.setText(file_path)
-                # 自动设置输出目录为UI文件所在目录
-                if not self.output_dir_edit.text():
-                    self.output_dir_edit.setText(os.path.dirname(file_path))
-                self.output_text.append(f"📁 已选择UI文件: {file_path}")
-        except Exception as e:
-            logger.error(f"浏览UI文件失败: {str(e)}")
-            QMessageBox.critical(self, "错误", f"选择文件时发生错误:\n{str(e)}")
-
+        from PyQt6.QtWidgets import QFileDialog
+
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "选择UI文件",
+            "",
+            "Qt UI文件 (*.ui);;所有文件 (*.*)"
+        )
+
+        if file_path:
+            self.ui_file_edit.setText(file_path)
+            # 自动设置输出目录为UI文件所在目录
+            if not self.output_dir_edit.text():
+                self.output_dir_edit.setText(os.path.dirname(file_path))
+            self.append_output(f"已选择UI文件: {file_path}")
+
+    @_gui_errors("错误", "选择目录时发生错误")
     def browse_output_dir(self):
         """浏览输出目录"""
-        try:
-            dir_path = QFileDialog.getExistingDirectory(
-                self,
-                "选择输出目录"
-            )
-
-            if dir_path:
-                self.output_dir_edit.setText(dir_path)
-                self.output_text.append(f"📁 已选择输出目录: {dir_path}")
-        except Exception as e:
-            logger.error(f"浏览输出目录失败: {str(e)}")
-            QMessageBox.critical(self, "错误", f"选择目录时发生错误:\n{str(e)}")
+        from PyQt6.QtWidgets import QFileDialog
+
+        dir_path = QFileDialog.getExistingDirectory(
+            self,
+            "选择输出目录"
+        )
+
+        if dir_path:
+            self.output_dir_edit.setText(dir_path)
+            self.append_output(f"已选择输出目录: {dir_path}")
 
     def convert_ui_file(self):
         """转换UI文件"""
+        from PyQt6.QtWidgets import QMessageBox
+
         try:
             ui_file = self.ui_file_edit.text().strip()
             output_dir = self.output_dir_edit.text().strip()
@@ -476,52 +388,55 @@ class DesignerLauncher(QMainWindow):
                 output_dir = os.path.dirname(ui_file)
                 self.output_dir_edit.setText(output_dir)
 
-            # 禁用转换按钮，显示进度条
+            # 禁用转换按钮，显示转换状态提示
             self.convert_btn.setEnabled(False)
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)  # 无限进度条
+            self.progress_label.setVisible(True)
 
             # 清空输出文本
+            self._pending_msgs.clear()
             self.output_text.clear()
 
-            # 启动转换线程
-            self.convert_thread = ConvertThread(ui_file, output_dir)
-            self.convert_thread.progress.connect(self.on_convert_progress)
-            self.convert_thread.finished.connect(self.on_convert_finished)
-            self.convert_thread.start()
+            # 投递转换任务到工作线程
+            self._worker.job.emit(ui_file, output_dir)
 
         except Exception as e:
             logger.error(f"转换UI文件失败: {str(e)}", exc_info=True)
             QMessageBox.critical(self, "转换错误", f"启动转换时发生错误:\n{str(e)}")
             self.convert_btn.setEnabled(True)
-            self.progress_bar.setVisible(False)
+            self.progress_label.setVisible(False)
 
     def on_convert_progress(self, message):
         """转换进度更新"""
-        self.output_text.append(f"⏳ {message}")
+        self.append_output(message)
         self.statusBar.showMessage(message)
 
     def on_convert_finished(self, success, message):
         """转换完成"""
+        from PyQt6.QtWidgets import QMessageBox
+
         self.convert_btn.setEnabled(True)
-        self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
 
+        # 转换结果已由 convert_ui_to_py 或工作线程记录过日志
         if success:
-            self.output_text.append(f"✅ {message}")
+            self.append_output(message, log=False)
             self.statusBar.showMessage("转换完成")
             QMessageBox.information(self, "成功", message)
         else:
-            self.output_text.append(f"❌ {message}")
+            self.append_output(message, log=False)
             self.statusBar.showMessage("转换失败")
             QMessageBox.critical(self, "转换失败", message)
 
+    @_gui_errors("错误", "获取系统信息失败")
     def show_system_info(self):
         """显示系统信息"""
-        try:
+        from PyQt6.QtWidgets import QMessageBox
+
+        if self._sysinfo_cache is None:
             info = get_system_info()
             pyqt_status, pyqt_version = check_pyqt6_installation()
 
-            info_text = f"""系统信息:
+            self._sysinfo_cache = f"""系统信息:
 操作系统: {info['system']} {info['version']}
 Python版本: {info['python']}
 系统架构: {info['architecture']}
@@ -530,37 +445,37 @@ Python版本: {info['python']}
 
 PyQt6状态: {'已安装' if pyqt_status else '未安装'}
 PyQt6版本: {pyqt_version if pyqt_version else 'N/A'}
+"""
 
+        # Designer路径可能在运行期间改变，每次显示时单独拼接
+        info_text = f"""{self._sysinfo_cache}
 Designer路径: {self.designer_path if self.designer_path else '未设置'}
 """
 
-            QMessageBox.information(self, "系统信息", info_text)
-        except Exception as e:
-            logger.error(f"显示系统信息失败: {str(e)}")
-            QMessageBox.critical(self, "错误", f"获取系统信息失败:\n{str(e)}")
+        QMessageBox.information(self, "系统信息", info_text)
 
+    @_gui_errors("错误", "打开日志文件失败")
     def view_log(self):
         """查看日志"""
-        try:
-            from utils import get_app_data_dir
-            log_file = get_app_data_dir() / "launcher.log"
-
-            if log_file.exists():
-                # 尝试用系统默认程序打开日志文件
-                if platform.system() == "Windows":
-                    os.startfile(str(log_file))
-                elif platform.system() == "Darwin":  # macOS
-                    subprocess.run(["open", str(log_file)])
-                else:  # Linux
-                    subprocess.run(["xdg-open", str(log_file)])
-            else:
-                QMessageBox.information(self, "提示", "日志文件不存在")
-        except Exception as e:
-            logger.error(f"查看日志失败: {str(e)}")
-            QMessageBox.critical(self, "错误", f"打开日志文件失败:\n{str(e)}")
+        import subprocess
+        from PyQt6.QtWidgets import QMessageBox
+        log_file = get_log_file()
+
+        if os.path.exists(log_file):
+            # 尝试用系统默认程序打开日志文件
+            if _IS_WINDOWS:
+                os.startfile(log_file)
+            elif _IS_MAC:
+                subprocess.run(["open", log_file])
+            else:  # Linux
+                subprocess.run(["xdg-open", log_file])
+        else:
+            QMessageBox.information(self, "提示", "日志文件不存在")
 
     def show_about(self):
         """显示关于信息"""
+        from PyQt6.QtWidgets import QMessageBox
+
         about_text = """PyQt6界面设计器启动器 v1.0.1
 
 一个简单易用的PyQt6界面设计器启动工具
@@ -582,6 +497,8 @@ GitHub: https://github.com/HeMOua/pyqt-designer-launcher
         """关闭事件"""
         try:
             self.save_settings()
+            self._worker_thread.quit()
+            self._worker_thread.wait()
             logger.info("程序正常关闭")
             event.accept()
         except Exception as e:
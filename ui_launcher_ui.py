@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PyQt6界面设计器启动器
+界面布局（仅负责构建控件树，信号连接和业务逻辑见 ui_launcher.py）
+"""
+
+# 仅导入构建初始窗口所需的类，其余在使用处延迟导入以加快启动
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
+                             QLabel, QLineEdit, QPushButton, QGroupBox,
+                             QCheckBox, QStatusBar)
+from PyQt6.QtCore import Qt
+
+# 样式表在模块级定义并合并为一份，只在主窗口上设置一次，由子控件继承
+_MAIN_QSS = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: white;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #2c3e50;
+    }
+    QPushButton {
+        background-color: #3498db;
+        border: none;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+    QPushButton:pressed {
+        background-color: #21618c;
+    }
+    QPushButton:disabled {
+        background-color: #bdc3c7;
+        color: #7f8c8d;
+    }
+    QLineEdit {
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+        padding: 5px;
+        background-color: white;
+    }
+    QTextEdit {
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QLabel#titleLabel {
+        color: #2c3e50;
+        font-size: 24px;
+        font-weight: bold;
+        margin: 10px 0;
+        background-color: transparent;
+    }
+"""
+
+_LAUNCH_BTN_QSS = """
+    QPushButton#launchBtn {
+        font-size: 14px;
+        padding: 12px 24px;
+        background-color: #27ae60;
+    }
+    QPushButton#launchBtn:hover {
+        background-color: #229954;
+    }
+    QPushButton#launchBtn:pressed {
+        background-color: #1e8449;
+    }
+"""
+
+_CONVERT_BTN_QSS = """
+    QPushButton#convertBtn {
+        font-size: 14px;
+        padding: 10px 20px;
+        background-color: #e74c3c;
+    }
+    QPushButton#convertBtn:hover {
+        background-color: #c0392b;
+    }
+    QPushButton#convertBtn:pressed {
+        background-color: #a93226;
+    }
+"""
+
+_STYLE_SHEET = _MAIN_QSS + _LAUNCH_BTN_QSS + _CONVERT_BTN_QSS
+
+
+class Ui_DesignerLauncher:
+    """启动器主窗口的控件布局"""
+
+    def setupUi(self, main_window):
+        """在主窗口上构建控件树"""
+        from PyQt6.QtWidgets import QSplitter
+
+        main_window.setWindowTitle("PyQt6界面设计器启动器 v1.0.1")
+        main_window.setGeometry(100, 100, 800, 600)
+        main_window.setMinimumSize(600, 400)
+
+        # 设置样式
+        main_window.setStyleSheet(_STYLE_SHEET)
+
+        # 创建中央部件
+        central_widget = QWidget()
+        main_window.setCentralWidget(central_widget)
+
+        # 主布局
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setSpacing(15)
+        main_layout.setContentsMargins(15, 15, 15, 15)
+
+        # 创建标题
+        title_label = QLabel("PyQt6界面设计器启动器")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_label.setObjectName("titleLabel")
+        main_layout.addWidget(title_label)
+
+        # 创建分割器
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        main_layout.addWidget(splitter)
+
+        # Qt Designer 启动区域
+        designer_group = self.create_designer_group()
+        splitter.addWidget(designer_group)
+
+        # UI转换区域
+        convert_group = self.create_convert_group()
+        splitter.addWidget(convert_group)
+
+        # 设置分割器比例
+        splitter.setSizes([200, 400])
+
+        # 创建状态栏
+        self.statusBar = QStatusBar()
+        main_window.setStatusBar(self.statusBar)
+        self.statusBar.showMessage("就绪")
+
+    def create_designer_group(self):
+        """创建Qt Designer启动组"""
+        group = QGroupBox("Qt Designer 启动器")
+        layout = QVBoxLayout(group)
+        layout.setSpacing(10)
+
+        # Designer路径显示
+        path_layout = QHBoxLayout()
+        path_label = QLabel("Designer路径:")
+        self.path_edit = QLineEdit()
+        self.path_edit.setReadOnly(True)
+        self.path_edit.setPlaceholderText("正在检测Qt Designer路径...")
+
+        self.browse_btn = QPushButton("浏览")
+        self.browse_btn.setMaximumWidth(80)
+
+        self.test_btn = QPushButton("测试")
+        self.test_btn.setMaximumWidth(60)
+
+        path_layout.addWidget(path_label)
+        path_layout.addWidget(self.path_edit)
+        path_layout.addWidget(self.browse_btn)
+        path_layout.addWidget(self.test_btn)
+        layout.addLayout(path_layout)
+
+        # 自动检测复选框
+        self.auto_detect_cb = QCheckBox("启动时自动检测Designer路径")
+        layout.addWidget(self.auto_detect_cb)
+
+        # 启动按钮
+        button_layout = QHBoxLayout()
+        self.launch_btn = QPushButton("🎨 启动 Qt Designer")
+        self.launch_btn.setEnabled(False)
+        self.launch_btn.setObjectName("launchBtn")
+
+        button_layout.addStretch()
+        button_layout.addWidget(self.launch_btn)
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+
+        return group
+
+    def create_convert_group(self):
+        """创建UI转换组"""
+        from PyQt6.QtWidgets import QGridLayout, QTextEdit
+
+        group = QGroupBox("UI文件转换器")
+        layout = QVBoxLayout(group)
+        layout.setSpacing(10)
+
+        # 文件选择区域
+        file_layout = QGridLayout()
+
+        # UI文件选择
+        ui_label = QLabel("UI文件:")
+        self.ui_file_edit = QLineEdit()
+        self.ui_file_edit.setPlaceholderText("选择要转换的.ui文件")
+        self.ui_browse_btn = QPushButton("选择文件")
+
+        file_layout.addWidget(ui_label, 0, 0)
+        file_layout.addWidget(self.ui_file_edit, 0, 1)
+        file_layout.addWidget(self.ui_browse_btn, 0, 2)
+
+        # 输出目录选择
+        output_label = QLabel("输出目录:")
+        self.output_dir_edit = QLineEdit()
+        self.output_dir_edit.setPlaceholderText("选择输出目录（默认为UI文件同目录）")
+        self.output_browse_btn = QPushButton("选择目录")
+
+        file_layout.addWidget(output_label, 1, 0)
+        file_layout.addWidget(self.output_dir_edit, 1, 1)
+        file_layout.addWidget(self.output_browse_btn, 1, 2)
+
+        layout.addLayout(file_layout)
+
+        # 转换按钮
+        convert_layout = QHBoxLayout()
+        self.convert_btn = QPushButton("🔄 转换为Python文件")
+        self.convert_btn.setObjectName("convertBtn")
+
+        convert_layout.addStretch()
+        convert_layout.addWidget(self.convert_btn)
+        convert_layout.addStretch()
+        layout.addLayout(convert_layout)
+
+        # 转换状态提示（使用静态文本，避免忙碌进度条的持续重绘）
+        self.progress_label = QLabel("⏳ 转换中...")
+        self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.progress_label.setVisible(False)
+        layout.addWidget(self.progress_label)
+
+        # 输出信息
+        self.output_text = QTextEdit()
+        self.output_text.setPlaceholderText("转换信息将在这里显示...")
+        layout.addWidget(self.output_text)
+
+        return group
@@ -4,305 +4,582 @@
 工具函数模块
 """
 
+import io
 import os
 import sys
+import stat
 import platform
-import subprocess
 import logging
 import json
+import shutil
+import fnmatch
+import functools
 from pathlib import Path
-from PyQt6.QtCore import QStandardPaths
+
+try:
+    # 可选依赖：安装了orjson时用它读写配置，速度更快
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# 操作系统名称在进程运行期间不会变化，只获取一次
+_SYSTEM = platform.system()
+
+# 是否为PyInstaller打包环境，运行期间不会变化
+IS_FROZEN = bool(getattr(sys, 'frozen', False))
+
+# 程序运行目录：打包后为可执行文件所在目录，开发环境为源码目录
+if IS_FROZEN:
+    _APP_DIR = os.path.dirname(sys.executable)
+else:
+    _APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 打包时附带的Designer路径提示文件名
+_DESIGNER_HINT_FILE = "designer_path_hint.json"
+
+# Designer可执行文件名
+_DESIGNER_BINNAME = "designer.exe" if _SYSTEM == "Windows" else "designer"
+
+# 当前平台的常见安装路径，在模块加载时选定。
+# 固定路径直接检查；通配符路径写成 (根目录, 逐级子目录通配符, 固定后缀)，
+# 每一级可以是一个通配符或多个通配符组成的元组
+if _SYSTEM == "Windows":
+    _COMMON_PATHS = (
+        (r"C:\Qt", ("*", ("mingw*", "msvc*")), r"bin\designer.exe"),
+        r"C:\Qt\Tools\QtCreator\bin\designer.exe",
+        (r"C:\Program Files\Qt", ("*", ("mingw*", "msvc*")), r"bin\designer.exe"),
+        r".\Qt\bin\designer.exe",
+        r"..\Qt\bin\designer.exe",
+    )
+elif _SYSTEM == "Darwin":  # macOS
+    _COMMON_PATHS = (
+        "/usr/local/bin/designer",
+        "/opt/homebrew/bin/designer",
+        ("/Applications", ("Qt*", "*"), "clang_64/bin/designer"),
+        ("/usr/local", ("Qt*", "*"), "clang_64/bin/designer"),
+    )
+else:  # Linux
+    _COMMON_PATHS = (
+        "/usr/bin/designer",
+        "/usr/local/bin/designer",
+        ("/opt", ("Qt*", "*"), "gcc_64/bin/designer"),
+        "/usr/lib/qt6/bin/designer",
+        "/usr/lib/x86_64-linux-gnu/qt6/bin/designer",
+    )
+
+# site-packages 中可能包含Designer的目录：qt6-applications 和 PyQt6 自带的 Qt6
+_SITE_DESIGNER_DIRS = (
+    os.path.join("qt6_applications", "Qt", "bin"),
+    os.path.join("PyQt6", "Qt6", "bin"),
+)
+
+# site-packages 目录列表，由 _get_site_packages 首次调用时填充
+_SITE_PKGS = None
+
+# 已转换UI文件的生成代码缓存，键为 (UI文件路径, 内容哈希)
+_COMPILED_UI_CACHE = {}
+_COMPILED_UI_CACHE_SIZE = 32
+
+# 常见安装路径的根目录是否存在，避免重复检查不存在的目录
+_ROOT_EXISTS = {}
+
+# 配置文件缓存：记录文件修改时间和解析结果，文件未变化时不重复解析
+_CONFIG_CACHE = {"mtime": None, "data": None}
+
 
 def get_app_data_dir():
     """获取应用程序数据目录"""
-    if getattr(sys, 'frozen', False):
-        # PyInstaller打包后的环境
-        app_dir = Path(sys.executable).parent
-    else:
-        # 开发环境
-        app_dir = Path(__file__).parent
-
-    return app_dir
+    return _APP_DIR
 
 
 def get_config_file():
     """获取配置文件路径"""
     config_dir = get_app_data_dir()
-    return config_dir / "config.json"
+    return os.path.join(config_dir, "config.json")
+
+
+def get_log_file():
+    """获取日志文件路径"""
+    return os.path.join(get_app_data_dir(), "launcher.log")
+
+
+def _json_loads(data):
+    """从UTF-8字节解析JSON"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """将对象序列化为缩进2格的UTF-8 JSON字节"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
 
 
 def save_config(config_data):
     """保存配置"""
     try:
         config_file = get_config_file()
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"配置已保存到: {config_file}")
+        new_content = _json_dumps(config_data)
+
+        # 内容与磁盘上的文件相同时跳过写入
+        mode = None
+        try:
+            with open(config_file, 'rb') as f:
+                old_content = f.read()
+                mode = stat.S_IMODE(os.fstat(f.fileno()).st_mode)
+            if old_content == new_content:
+                logger.debug("配置未变化，跳过保存: %s", config_file)
+                return
+        except FileNotFoundError:
+            pass
+
+        import threading
+
+        # 先写入临时文件再替换，避免写入中断导致配置文件损坏。
+        # 临时文件按 0666 创建，由系统套用 umask，与直接 open() 新建的文件权限一致；
+        # 已有配置文件时沿用原文件的权限
+        tmp_path = f"{config_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        fd = os.open(tmp_path, flags, 0o666)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(new_content)
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, config_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        # 写入后同步更新缓存，下次加载无需重新解析
+        _CONFIG_CACHE["data"] = dict(config_data)
+        _CONFIG_CACHE["mtime"] = os.stat(config_file).st_mtime_ns
+        logger.info("配置已保存到: %s", config_file)
     except Exception as e:
-        logger.error(f"保存配置失败: {str(e)}")
+        logger.error("保存配置失败: %s", e)
+
+
+def _get_config_cached():
+    """读取配置文件，文件修改时间未变化时直接返回缓存的解析结果"""
+    config_file = get_config_file()
+    try:
+        mtime = os.stat(config_file).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    if mtime != _CONFIG_CACHE["mtime"]:
+        with open(config_file, 'rb') as f:
+            data = _json_loads(f.read())
+        _CONFIG_CACHE["data"] = data
+        _CONFIG_CACHE["mtime"] = mtime
+        logger.info("配置已加载: %s", config_file)
+
+    return _CONFIG_CACHE["data"]
 
 
 def load_config():
     """加载配置"""
     try:
-        config_file = get_config_file()
-        if config_file.exists():
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            logger.info(f"配置已加载: {config_file}")
-            return config
+        # 返回副本，调用方修改配置不会影响缓存
+        return dict(_get_config_cached())
     except Exception as e:
-        logger.error(f"加载配置失败: {str(e)}")
+        logger.error("加载配置失败: %s", e)
 
     return {}
 
 
+class LauncherConfig:
+    """启动器配置"""
+
+    __slots__ = ('auto_detect', 'designer_path', '_extra')
+
+    _KNOWN_KEYS = ('auto_detect', 'designer_path')
+
+    def __init__(self, auto_detect=True, designer_path="", extra=None):
+        self.auto_detect = auto_detect
+        self.designer_path = designer_path
+        # 未识别的字段原样保留，保存时写回，避免丢失较新版本或手动添加的配置
+        self._extra = dict(extra) if extra else {}
+
+    @classmethod
+    def from_dict(cls, data):
+        """从配置字典创建，未知字段保存在 _extra 中"""
+        return cls(
+            auto_detect=data.get('auto_detect', True),
+            designer_path=data.get('designer_path') or "",
+            extra={k: v for k, v in data.items() if k not in cls._KNOWN_KEYS},
+        )
+
+    def to_dict(self):
+        """转换为可保存的配置字典"""
+        data = dict(self._extra)
+        data['auto_detect'] = self.auto_detect
+        data['designer_path'] = self.designer_path
+        return data
+
+    def snapshot(self):
+        """返回当前配置的不可变快照，用于判断配置是否发生变化"""
+        return (self.auto_detect, self.designer_path)
+
+
 def is_pyinstaller_environment():
     """检测是否为PyInstaller打包环境"""
-    return getattr(sys, 'frozen', False)
+    return IS_FROZEN
 
 
+@functools.lru_cache(maxsize=1)
 def find_designer_path():
-    """查找Qt Designer路径"""
+    """查找Qt Designer路径
+
+    同一进程内只检测一次，之后直接返回缓存结果；
+    需要重新检测时先调用 find_designer_path.cache_clear()。
+    """
+    return _find_designer_path_uncached()
+
+
+def _find_designer_path_uncached():
+    """查找Qt Designer路径（不使用缓存）"""
     logger.info("开始检测Qt Designer路径")
 
     # 首先尝试从配置文件加载
     config = load_config()
     saved_path = config.get('designer_path')
-    if saved_path and os.path.exists(saved_path):
-        logger.info(f"从配置文件加载Designer路径: {saved_path}")
+    if saved_path and os.path.isfile(saved_path):
+        logger.info("从配置文件加载Designer路径: %s", saved_path)
         return saved_path
 
-    system = platform.system()
-    logger.info(f"操作系统: {system}")
-    logger.info(f"运行环境: {'PyInstaller打包' if is_pyinstaller_environment() else '开发环境'}")
+    # 打包环境中优先使用构建时写入的路径提示，找到即可跳过各检测策略
+    hint_path = _check_frozen_hint()
+    if hint_path:
+        logger.info("从打包提示文件加载Designer路径: %s", hint_path)
+        return hint_path
+
+    logger.info("操作系统: %s", _SYSTEM)
+    logger.info("运行环境: %s", 'PyInstaller打包' if IS_FROZEN else '开发环境')
 
-    # 检测策略列表
+    # 检测策略列表（按优先级排列）
     detection_strategies = [
         _check_path_designer,
         _check_common_paths_designer,
         _check_python_site_packages,
     ]
 
-    for strategy in detection_strategies:
-        try:
-            path = strategy()
-            if path:
-                logger.info(f"通过 {strategy.__name__} 找到Designer: {path}")
-                # 保存到配置文件
-                config['designer_path'] = path
-                save_config(config)
-                return path
-        except Exception as e:
-            logger.warning(f"{strategy.__name__} 检测失败: {str(e)}")
+    strategy, path = _run_detection_strategies(detection_strategies)
+    if path:
+        logger.info("通过 %s 找到Designer: %s", strategy.__name__, path)
+        # 保存到配置文件
+        config['designer_path'] = path
+        save_config(config)
+        return path
 
     logger.warning("未找到Qt Designer")
     return None
 
 
-def _check_path_designer():
-    """检查PATH环境变量中的designer"""
-    logger.debug("检查PATH环境变量中的designer")
+def _check_frozen_hint():
+    """读取打包时附带的 designer_path_hint.json
+
+    提示文件中的相对路径相对于程序运行目录解析。
+    """
+    if not IS_FROZEN:
+        return None
 
+    bundle_dir = getattr(sys, '_MEIPASS', _APP_DIR)
+    hint_file = os.path.join(bundle_dir, _DESIGNER_HINT_FILE)
     try:
-        if platform.system() == "Windows":
-            result = subprocess.run(["where", "designer"],
-                                    capture_output=True, text=True, check=True, timeout=10)
-        else:
-            result = subprocess.run(["which", "designer"],
-                                    capture_output=True, text=True, check=True, timeout=10)
-
-        if result.stdout.strip():
-            path = result.stdout.strip().split('\n')[0]
-            if os.path.exists(path):
-                return path
+        with open(hint_file, 'rb') as f:
+            hint = _json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("读取打包提示文件失败: %s", e)
+        return None
 
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-        logger.debug(f"PATH检查失败: {str(e)}")
+    path = hint.get('designer_path') if isinstance(hint, dict) else None
+    if not path:
+        return None
 
+    path = os.path.normpath(os.path.join(_APP_DIR, path))
+    if os.path.isfile(path):
+        return path
+
+    logger.debug("打包提示文件中的路径不存在: %s", path)
     return None
 
 
+def _run_detection_strategies(strategies):
+    """并行执行各检测策略，返回 (策略, 路径)
+
+    各策略互不依赖且以I/O为主，同时执行后按优先级取结果：
+    只有优先级更高的策略都已结束且未找到时，才采用后面策略的结果。
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    executor = ThreadPoolExecutor(max_workers=len(strategies))
+    try:
+        futures = [executor.submit(strategy) for strategy in strategies]
+        results = {}
+
+        for finished in as_completed(futures):
+            index = futures.index(finished)
+            try:
+                results[index] = finished.result()
+            except Exception as e:
+                logger.warning("%s 检测失败: %s", strategies[index].__name__, e)
+                results[index] = None
+
+            # 按优先级检查，遇到尚未结束的更高优先级策略则继续等待
+            for i, strategy in enumerate(strategies):
+                if i not in results:
+                    break
+                if results[i]:
+                    return strategy, results[i]
+    finally:
+        # 已得到结果时不等待其余策略结束
+        executor.shutdown(wait=False)
+
+    return None, None
+
+
+def _check_path_designer():
+    """检查PATH环境变量中的designer"""
+    logger.debug("检查PATH环境变量中的designer")
+
+    # shutil.which 在当前进程内按 PATH/PATHEXT 查找，无需启动 where/which 子进程
+    return shutil.which("designer")
+
+
 def _check_common_paths_designer():
     """检查常见安装路径"""
     logger.debug("检查常见安装路径")
 
-    system = platform.system()
-
-    if system == "Windows":
-        common_paths = [
-            r"C:\Qt\*\mingw*\bin\designer.exe",
-            r"C:\Qt\*\msvc*\bin\designer.exe",
-            r"C:\Qt\Tools\QtCreator\bin\designer.exe",
-            r"C:\Program Files\Qt\*\mingw*\bin\designer.exe",
-            r"C:\Program Files\Qt\*\msvc*\bin\designer.exe",
-            r".\Qt\bin\designer.exe",
-            r"..\Qt\bin\designer.exe"
-        ]
-    elif system == "Darwin":  # macOS
-        common_paths = [
-            "/usr/local/bin/designer",
-            "/opt/homebrew/bin/designer",
-            "/Applications/Qt*/*/clang_64/bin/designer",
-            "/usr/local/Qt*/*/clang_64/bin/designer",
-        ]
-    else:  # Linux
-        common_paths = [
-            "/usr/bin/designer",
-            "/usr/local/bin/designer",
-            "/opt/Qt*/*/gcc_64/bin/designer",
-            "/usr/lib/qt6/bin/designer",
-            "/usr/lib/x86_64-linux-gnu/qt6/bin/designer",
-        ]
-
-    # 扩展通配符路径
-    expanded_paths = []
-    for path_pattern in common_paths:
-        if '*' in path_pattern:
-            try:
-                import glob
-                expanded = glob.glob(path_pattern)
-                expanded_paths.extend(expanded)
-            except Exception as e:
-                logger.debug(f"通配符扩展失败 {path_pattern}: {str(e)}")
-        else:
-            expanded_paths.append(path_pattern)
+    # 按顺序检查，找到第一个即返回
+    for entry in _COMMON_PATHS:
+        if isinstance(entry, str):
+            if os.path.isfile(entry):
+                return entry
+            continue
 
-    # 检查每个路径
-    for path in expanded_paths:
-        if os.path.exists(path):
+        root, fragments, suffix = entry
+        if root not in _ROOT_EXISTS:
+            _ROOT_EXISTS[root] = os.path.isdir(root)
+        if not _ROOT_EXISTS[root]:
+            continue
+
+        try:
+            path = _scan_designer_dirs(root, fragments, suffix)
+        except Exception as e:
+            logger.debug("扫描目录失败 %s: %s", root, e)
+            continue
+        if path:
             return path
 
     return None
 
 
+def _scan_designer_dirs(base, fragments, suffix):
+    """在 base 下逐级匹配子目录通配符，返回第一个存在的 suffix 路径
+
+    每个目录只读取一次，并且只进入名称匹配的子目录。
+    """
+    if not fragments:
+        path = os.path.join(base, suffix)
+        return path if os.path.isfile(path) else None
+
+    patterns = fragments[0] if isinstance(fragments[0], tuple) else (fragments[0],)
+    try:
+        with os.scandir(base) as it:
+            names = sorted(entry.name for entry in it
+                           if not entry.name.startswith('.') and entry.is_dir())
+    except OSError:
+        return None
+
+    for name in names:
+        if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            path = _scan_designer_dirs(os.path.join(base, name), fragments[1:], suffix)
+            if path:
+                return path
+
+    return None
+
+
 def _check_python_site_packages():
     """检查Python site-packages中的designer"""
     logger.debug("检查Python site-packages中的designer")
 
     try:
-        import site
-        site_packages = site.getsitepackages()
+        for site_pkg in _get_site_packages():
+            for sub_dir in _SITE_DESIGNER_DIRS:
+                designer_path = os.path.join(site_pkg, sub_dir, _DESIGNER_BINNAME)
+                if os.path.isfile(designer_path):
+                    return designer_path
 
-        for site_pkg in site_packages:
-            site_path = Path(site_pkg)
+    except Exception as e:
+        logger.debug("site-packages检查失败: %s", e)
 
-            # 检查qt6_applications
-            qt_apps_path = site_path / "qt6_applications" / "Qt" / "bin"
-            if platform.system() == "Windows":
-                designer_path = qt_apps_path / "designer.exe"
-            else:
-                designer_path = qt_apps_path / "designer"
+    return None
 
-            if designer_path.exists():
-                return str(designer_path)
 
-    except Exception as e:
-        logger.debug(f"site-packages检查失败: {str(e)}")
+def _get_site_packages():
+    """获取site-packages目录列表，首次调用后缓存"""
+    global _SITE_PKGS
 
-    return None
+    if _SITE_PKGS is None:
+        import site
+        _SITE_PKGS = tuple(site.getsitepackages())
+    return _SITE_PKGS
 
 
 def test_designer_executable(designer_path):
     """测试Designer可执行文件是否有效"""
+    # 只通过文件系统检查，不再启动 designer -h 子进程
+    logger.debug("测试Designer可执行文件: %s", designer_path)
+    return os.path.isfile(designer_path) and os.access(designer_path, os.X_OK)
+
+
+def _compile_ui_in_process(ui_file, output_file):
+    """在当前进程内用compileUi转换UI文件
+
+    在内存中生成代码，再整体写入输出文件；
+    相同路径、相同内容的UI文件复用上次生成的代码。
+    """
+    import hashlib
+
+    with open(ui_file, 'rb') as f:
+        ui_bytes = f.read()
+    cache_key = (os.path.abspath(ui_file), hashlib.sha1(ui_bytes).hexdigest())
+
+    code = _COMPILED_UI_CACHE.get(cache_key)
+    if code is None:
+        from PyQt6.uic import compileUi
+
+        # 传入文件路径而不是文件对象，图标等相对路径才会按UI文件所在目录解析
+        buffer = io.StringIO()
+        compileUi(ui_file, buffer, execute=True)
+        code = buffer.getvalue()
+
+        if len(_COMPILED_UI_CACHE) >= _COMPILED_UI_CACHE_SIZE:
+            _COMPILED_UI_CACHE.pop(next(iter(_COMPILED_UI_CACHE)))
+        _COMPILED_UI_CACHE[cache_key] = code
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(code)
+
+
+def _compile_ui_subprocess(ui_file, output_file):
+    """通过pyuic命令行转换UI文件，成功返回None，失败返回错误信息"""
+    import subprocess
+
+    cmd = [
+        sys.executable, "-m", "PyQt6.uic.pyuic",
+        "-x",  # 生成额外的测试代码
+        ui_file,
+        "-o", output_file
+    ]
+
+    logger.debug("执行命令: %s", cmd)
+
     try:
-        logger.debug(f"测试Designer可执行文件: {designer_path}")
-        result = subprocess.run([designer_path, "-h"],
-                                capture_output=True, text=True,
-                                timeout=10, check=True)
-        logger.debug(f"Designer版本信息: {result.stdout}")
-        return True
-    except Exception as e:
-        logger.warning(f"Designer测试失败: {str(e)}")
-        return False
+        subprocess.run(cmd, capture_output=True, text=True,
+                       check=True, timeout=30)
+    except subprocess.CalledProcessError as e:
+        error_msg = e.stderr if e.stderr else str(e)
+        logger.error("转换失败: %s", error_msg)
+        return f"转换失败：{error_msg}"
+    except subprocess.TimeoutExpired:
+        logger.error("转换超时")
+        return "转换超时，请检查UI文件是否有效"
+
+    return None
 
 
 def convert_ui_to_py(ui_file, output_dir):
     """将UI文件转换为Python文件"""
-    logger.info(f"开始转换UI文件: {ui_file}")
+    return convert_ui_files([ui_file], output_dir)[0]
+
+
+def convert_ui_files(ui_files, output_dir):
+    """批量将UI文件转换为Python文件
+
+    返回与 ui_files 顺序对应的 (是否成功, 信息) 列表。
+    """
+    return [_convert_ui_file(ui_file, output_dir) for ui_file in ui_files]
+
+
+def _convert_ui_file(ui_file, output_dir):
+    """转换单个UI文件"""
+    logger.info("开始转换UI文件: %s", ui_file)
 
     try:
         # 获取UI文件名（不含扩展名）
         ui_filename = Path(ui_file).stem
         py_filename = f"{ui_filename}.py"
-        output_file = Path(output_dir) / py_filename
+        output_file = os.path.join(output_dir, py_filename)
 
-        logger.info(f"输出文件: {output_file}")
+        logger.info("输出文件: %s", output_file)
 
-        # 构建pyuic6命令
-        if is_pyinstaller_environment():
-            # 在打包环境中，尝试直接使用pyuic6模块
-            try:
-                from PyQt6.uic import compileUi
-                with open(ui_file, 'r', encoding='utf-8') as ui_f:
-                    with open(output_file, 'w', encoding='utf-8') as py_f:
-                        compileUi(ui_f, py_f, execute=True)
+        # 优先在当前进程内转换，无法导入 PyQt6.uic 时才启动 pyuic 子进程
+        try:
+            _compile_ui_in_process(ui_file, output_file)
+        except ImportError as e:
+            logger.warning("无法使用compileUi，改用命令行转换: %s", e)
+            error_msg = _compile_ui_subprocess(ui_file, output_file)
+            if error_msg:
+                return False, error_msg
 
-                if output_file.exists():
-                    logger.info("UI转换成功 (使用compileUi)")
-                    return True, f"转换成功！\nUI文件: {ui_file}\nPython文件: {output_file}"
+            # 子进程方式需要检查输出文件是否创建成功；进程内转换已直接写入文件
+            if not os.path.exists(output_file):
+                logger.error("转换失败：输出文件未创建")
+                return False, "转换失败：输出文件未创建"
 
-            except Exception as e:
-                logger.warning(f"compileUi转换失败: {str(e)}")
-
-        # 标准命令行方式
-        cmd = [
-            sys.executable, "-m", "PyQt6.uic.pyuic",
-            "-x",  # 生成额外的测试代码
-            ui_file,
-            "-o", str(output_file)
-        ]
-
-        logger.debug(f"执行命令: {' '.join(cmd)}")
-
-        # 执行转换
-        result = subprocess.run(cmd, capture_output=True, text=True,
-                                check=True, timeout=30)
-
-        # 检查输出文件是否创建成功
-        if output_file.exists():
-            logger.info("UI转换成功")
-            return True, f"转换成功！\nUI文件: {ui_file}\nPython文件: {output_file}"
-        else:
-            logger.error("转换失败：输出文件未创建")
-            return False, "转换失败：输出文件未创建"
+        logger.info("UI转换成功")
+        return True, f"转换成功！\nUI文件: {ui_file}\nPython文件: {output_file}"
 
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr if e.stderr else str(e)
-        logger.error(f"转换失败: {error_msg}")
-        return False, f"转换失败：{error_msg}"
-    except subprocess.TimeoutExpired:
-        logger.error("转换超时")
-        return False, "转换超时，请检查UI文件是否有效"
     except Exception as e:
-        logger.error(f"转换过程中发生错误: {str(e)}", exc_info=True)
+        logger.error("转换过程中发生错误: %s", e, exc_info=True)
         return False, f"转换过程中发生错误：{str(e)}"
 
 
 def check_pyqt6_installation():
     """检查PyQt6是否已安装"""
     try:
-        import PyQt6
-        logger.info(f"PyQt6版本: {PyQt6.QtCore.PYQT_VERSION_STR}")
-        return True, PyQt6.QtCore.PYQT_VERSION_STR
+        from PyQt6.QtCore import PYQT_VERSION_STR
+        logger.info("PyQt6版本: %s", PYQT_VERSION_STR)
+        return True, PYQT_VERSION_STR
     except ImportError:
         logger.error("PyQt6未安装")
         return False, None
 
 
+@functools.lru_cache(maxsize=1)
+def _get_platform_info():
+    """获取不会变化的平台信息，只在首次调用时查询
+
+    platform.architecture() 每次调用都可能执行 file 命令，因此缓存结果；
+    也不在模块加载时计算，以免拖慢启动。
+    """
+    return {
+        "system": _SYSTEM,
+        "version": platform.version(),
+        "architecture": platform.architecture()[0],
+    }
+
+
 def get_system_info():
     """获取系统信息"""
+    platform_info = _get_platform_info()
     info = {
-        "system": platform.system(),
-        "version": platform.version(),
+        "system": platform_info["system"],
+        "version": platform_info["version"],
         "python": sys.version,
-        "architecture": platform.architecture()[0],
-        "frozen": is_pyinstaller_environment(),
+        "architecture": platform_info["architecture"],
+        "frozen": IS_FROZEN,
         "executable": sys.executable,
     }
 
-    logger.info(f"系统信息: {info}")
+    logger.info("系统信息: %s", info)
     return info
\ No newline at end of file